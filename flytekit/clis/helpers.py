@@ -23,13 +23,17 @@ def parse_args_into_dict(input_arguments):
     return {split_arg[0]: split_arg[1] for split_arg in [input_arg.split("=", 1) for input_arg in input_arguments]}
 
 
+_FALSY_WORDS = frozenset({"false", "0", "off", "no"})
+
+
 def str2bool(str):
     """
     bool('False') is True in Python, so we need to do some string parsing.  Use the same words in ConfigParser
     :param Text str:
     :rtype: bool
     """
-    return str.lower() not in ["false", "0", "off", "no"]
+    # Check the raw string first to skip the lower() allocation when it is already lower-case.
+    return str not in _FALSY_WORDS and str.lower() not in _FALSY_WORDS
 
 
 # TODO Deprecated delete after deleting flyte_cli register
@@ -1,10 +1,13 @@
+import copy
 import datetime
+import logging
+import mmap
 import os
-import shutil
+import re
 import tempfile
 import time
 from abc import ABC, abstractmethod
-from functools import wraps
+from functools import lru_cache, wraps
 from hashlib import sha224 as _sha224
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
@@ -19,6 +22,47 @@ if TYPE_CHECKING:
     from flytekit.models import task as task_models
 
 
+@lru_cache(maxsize=None)
+def _flyte_context_manager():
+    """
+    Returns the FlyteContextManager class. The import has to stay out of module scope to avoid a circular
+    import, but caching it here means callers on hot paths pay for the sys.modules lookup only once.
+    """
+    # import here to avoid circular import
+    from flytekit.core.context_manager import FlyteContextManager
+
+    return FlyteContextManager
+
+
+class _DnsifyTable(dict):
+    """
+    A ``str.translate`` table encoding the per-character rules of :py:func:`_dnsify`: the separators '_', '-' and '.'
+    map to '-', upper-case characters map to '-' followed by their lower-case equivalent (for better readability),
+    and any other non-alphanumeric character is dropped. Entries are computed on first use and cached, so the
+    translation of previously seen characters runs entirely in C.
+    """
+
+    def __missing__(self, code):
+        ch = chr(code)
+        if ch == "_" or ch == "-" or ch == ".":
+            replacement: Optional[str] = "-"
+        elif not ch.isalnum():
+            replacement = None
+        elif ch.islower() or ch.isdigit():
+            replacement = ch
+        else:
+            replacement = "-" + ch.lower()
+        self[code] = replacement
+        return replacement
+
+
+_DNSIFY_TABLE = _DnsifyTable()
+_DASH_RUN_RE = re.compile(r"-+")
+# A name _dnsify would return unchanged: lower-case alphanumeric runs joined by single dashes.
+_DNS_COMPLIANT_MATCH = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*").fullmatch
+
+
+@lru_cache(maxsize=4096)
 def _dnsify(value: str) -> str:
     """
     Converts value into a DNS-compliant (RFC1035/RFC1123 DNS_LABEL). The resulting string must only consist of
@@ -28,32 +72,17 @@ def _dnsify(value: str) -> str:
     :param Text value:
     :rtype: Text
     """
-    res = ""
     MAX = 63
     HASH_LEN = 10
+    if len(value) < MAX and _DNS_COMPLIANT_MATCH(value):
+        # Most real names are already compliant (e.g. "my-task-v1"); return them untouched.
+        return value
     if len(value) >= MAX:
         h = _sha224(value.encode("utf-8")).hexdigest()[:HASH_LEN]
         value = "{}-{}".format(h, value[-(MAX - HASH_LEN - 1) :])
-    for ch in value:
-        if ch == "_" or ch == "-" or ch == ".":
-            # Convert '_' to '-' unless it's the first character, in which case we drop it.
-            if res != "" and len(res) < 62:
-                res += "-"
-        elif not ch.isalnum():
-            # Trim non-alphanumeric letters.
-            pass
-        elif ch.islower() or ch.isdigit():
-            # Character is already compliant, just append it.
-            res += ch
-        else:
-            # Character is upper-case. Add a '-' before it for better readability.
-            if res != "" and res[-1] != "-" and len(res) < 62:
-                res += "-"
-            res += ch.lower()
-
-    if len(res) > 0 and res[-1] == "-":
-        res = res[: len(res) - 1]
-
+    res = _DASH_RUN_RE.sub("-", value.translate(_DNSIFY_TABLE)).strip("-")
+    if len(res) > MAX:
+        res = res[:MAX].rstrip("-")
     return res
 
 
@@ -72,47 +101,34 @@ def _get_container_definition(
     memory_limit: Optional[Union[str, int]] = None,
     environment: Optional[Dict[str, str]] = None,
 ) -> "task_models.Container":
-    ephemeral_storage_limit = ephemeral_storage_limit
-    ephemeral_storage_request = ephemeral_storage_request
-    cpu_limit = cpu_limit
-    cpu_request = cpu_request
-    gpu_limit = gpu_limit
-    gpu_request = gpu_request
-    memory_limit = memory_limit
-    memory_request = memory_request
-
+    # import here to avoid circular import
     from flytekit.models import task as task_models
 
+    resource_entry = task_models.Resources.ResourceEntry
+    resource_name = task_models.Resources.ResourceName
+
     # TODO: Use convert_resources_to_resource_model instead of manually fixing the resources.
-    requests = []
-    if ephemeral_storage_request:
-        requests.append(
-            task_models.Resources.ResourceEntry(
-                task_models.Resources.ResourceName.EPHEMERAL_STORAGE,
-                ephemeral_storage_request,
-            )
+    requests = [
+        resource_entry(name, value)
+        for name, value in (
+            (resource_name.EPHEMERAL_STORAGE, ephemeral_storage_request),
+            (resource_name.CPU, cpu_request),
+            (resource_name.GPU, gpu_request),
+            (resource_name.MEMORY, memory_request),
         )
-    if cpu_request:
-        requests.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.CPU, cpu_request))
-    if gpu_request:
-        requests.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.GPU, gpu_request))
-    if memory_request:
-        requests.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.MEMORY, memory_request))
-
-    limits = []
-    if ephemeral_storage_limit:
-        limits.append(
-            task_models.Resources.ResourceEntry(
-                task_models.Resources.ResourceName.EPHEMERAL_STORAGE,
-                ephemeral_storage_limit,
-            )
+        if value
+    ]
+
+    limits = [
+        resource_entry(name, value)
+        for name, value in (
+            (resource_name.EPHEMERAL_STORAGE, ephemeral_storage_limit),
+            (resource_name.CPU, cpu_limit),
+            (resource_name.GPU, gpu_limit),
+            (resource_name.MEMORY, memory_limit),
         )
-    if cpu_limit:
-        limits.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.CPU, cpu_limit))
-    if gpu_limit:
-        limits.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.GPU, gpu_limit))
-    if memory_limit:
-        limits.append(task_models.Resources.ResourceEntry(task_models.Resources.ResourceName.MEMORY, memory_limit))
+        if value
+    ]
 
     if environment is None:
         environment = {}
@@ -128,8 +144,58 @@ def _get_container_definition(
     )
 
 
+def _build_resource_name_table() -> tuple:
+    """
+    Builds a tuple mapping each Resources.ResourceName enum number to its kubernetes resource key
+    (e.g. EPHEMERAL_STORAGE -> "ephemeral-storage"). The enum is finite and known at import time, so a
+    plain index replaces protobuf descriptor reflection and the lower()/replace() string allocations
+    on every per-resource lookup.
+    """
+    values = _core_task.Resources.ResourceName.DESCRIPTOR.values
+    table = [""] * (max(v.number for v in values) + 1)
+    for v in values:
+        table[v.number] = v.name.lower().replace("_", "-")
+    return tuple(table)
+
+
+_RESOURCE_NAME_TO_K8S = _build_resource_name_table()
+
+
 def _sanitize_resource_name(resource: "task_models.Resources.ResourceEntry") -> str:
-    return _core_task.Resources.ResourceName.Name(resource.name).lower().replace("_", "-")
+    return _RESOURCE_NAME_TO_K8S[resource.name]
+
+
+@lru_cache(maxsize=None)
+def _k8s_models():
+    """
+    Cached accessor for the kubernetes model classes used by _serialize_pod_spec. kubernetes is an
+    optional dependency and slow to import, so it is resolved once on first use rather than at module
+    import or on every call.
+    """
+    from kubernetes.client import V1PodSpec
+    from kubernetes.client.models import V1Container, V1EnvVar, V1ResourceRequirements
+
+    return V1PodSpec, V1Container, V1EnvVar, V1ResourceRequirements
+
+
+@lru_cache(maxsize=None)
+def _container_image_resolver():
+    """Cached accessor for get_registerable_container_image; imported lazily to avoid a circular import."""
+    from flytekit.core.python_auto_container import get_registerable_container_image
+
+    return get_registerable_container_image
+
+
+@lru_cache(maxsize=None)
+def _api_client():
+    """
+    Shared kubernetes ApiClient, used only for sanitize_for_serialization which is a pure function of its
+    input. Constructing a client per call would set up a Configuration and default headers that are never
+    used. The import stays lazy because kubernetes is an optional dependency.
+    """
+    from kubernetes.client import ApiClient
+
+    return ApiClient()
 
 
 def _serialize_pod_spec(
@@ -137,25 +203,40 @@ def _serialize_pod_spec(
     primary_container: "task_models.Container",
     settings: SerializationSettings,
 ) -> Dict[str, Any]:
-    # import here to avoid circular import
-    from kubernetes.client import ApiClient, V1PodSpec
-    from kubernetes.client.models import V1Container, V1EnvVar, V1ResourceRequirements
-
-    from flytekit.core.python_auto_container import get_registerable_container_image
+    V1PodSpec, V1Container, V1EnvVar, V1ResourceRequirements = _k8s_models()
+    get_registerable_container_image = _container_image_resolver()
 
     if pod_template.pod_spec is None:
         return {}
-    containers = cast(V1PodSpec, pod_template.pod_spec).containers
-    primary_exists = False
-
-    for container in containers:
-        if container.name == cast(PodTemplate, pod_template).primary_container_name:
-            primary_exists = True
-            break
-
-    if not primary_exists:
+    # Shallow-copy the pod spec and its containers rather than deep-copying the whole template; only the container
+    # attributes overwritten below are reassigned, so the caller's pod_template is left untouched without walking
+    # every nested attribute of the kubernetes model tree.
+    containers = [copy.copy(container) for container in cast(V1PodSpec, pod_template.pod_spec).containers]
+    # Hoist the attribute chains used on every loop iteration into locals.
+    primary_container_name = cast(PodTemplate, pod_template).primary_container_name
+    image_config = settings.image_config
+
+    resolved_images: Dict[str, str] = {}
+
+    def resolve_image(image) -> str:
+        # Containers in one pod spec frequently share the same image string, so parse each distinct
+        # image reference only once per serialization. ImageSpec images are passed through untouched
+        # since ImageBuildEngine already dedupes builds.
+        if not isinstance(image, str):
+            return get_registerable_container_image(image, image_config)
+        resolved = resolved_images.get(image)
+        if resolved is None:
+            resolved = resolved_images[image] = get_registerable_container_image(image, image_config)
+        return resolved
+
+    # The primary container's env vars do not depend on the loop below; build the V1EnvVar list once.
+    primary_env = None
+    if primary_container.env is not None:
+        primary_env = [V1EnvVar(name=key, value=val) for key, val in primary_container.env.items()]
+
+    if primary_container_name not in {container.name for container in containers}:
         # insert a placeholder primary container if it is not defined in the pod spec.
-        containers.append(V1Container(name=cast(PodTemplate, pod_template).primary_container_name))
+        containers.append(V1Container(name=primary_container_name))
     final_containers = []
 
     for container in containers:
@@ -163,51 +244,90 @@ def _serialize_pod_spec(
         # with the values given to ContainerTask.
         # The attributes include: image, command, args, resource, and env (env is unioned)
 
-        if container.name == cast(PodTemplate, pod_template).primary_container_name:
+        if container.name == primary_container_name:
             if container.image is None:
                 # Copy the image from primary_container only if the image is not specified in the pod spec.
                 container.image = primary_container.image
             else:
-                container.image = get_registerable_container_image(container.image, settings.image_config)
+                container.image = resolve_image(container.image)
 
             container.command = primary_container.command
             container.args = primary_container.args
 
-            limits, requests = {}, {}
-            for resource in primary_container.resources.limits:
-                limits[_sanitize_resource_name(resource)] = resource.value
-            for resource in primary_container.resources.requests:
-                requests[_sanitize_resource_name(resource)] = resource.value
-            resource_requirements = V1ResourceRequirements(limits=limits, requests=requests)
-            if len(limits) > 0 or len(requests) > 0:
+            limits = {_RESOURCE_NAME_TO_K8S[r.name]: r.value for r in primary_container.resources.limits}
+            requests = {_RESOURCE_NAME_TO_K8S[r.name]: r.value for r in primary_container.resources.requests}
+            if limits or requests:
                 # Important! Only copy over resource requirements if they are non-empty.
-                container.resources = resource_requirements
-            if primary_container.env is not None:
-                container.env = [V1EnvVar(name=key, value=val) for key, val in primary_container.env.items()] + (
-                    container.env or []
-                )
+                container.resources = V1ResourceRequirements(limits=limits, requests=requests)
+            if primary_env is not None:
+                container.env = primary_env + (container.env or [])
         else:
-            container.image = get_registerable_container_image(container.image, settings.image_config)
+            container.image = resolve_image(container.image)
 
         final_containers.append(container)
-    cast(V1PodSpec, pod_template.pod_spec).containers = final_containers
+    pod_spec = copy.copy(cast(V1PodSpec, pod_template.pod_spec))
+    pod_spec.containers = final_containers
 
-    return ApiClient().sanitize_for_serialization(cast(PodTemplate, pod_template).pod_spec)
+    return _api_client().sanitize_for_serialization(pod_spec)
 
 
 def load_proto_from_file(pb2_type, path):
+    out = pb2_type()
     with open(path, "rb") as reader:
-        out = pb2_type()
-        out.ParseFromString(reader.read())
-        return out
+        if os.fstat(reader.fileno()).st_size < 4096:
+            # For small files a plain read is cheaper than setting up a mapping.
+            out.ParseFromString(reader.read())
+        else:
+            # Memory-map larger files so protobuf parses straight out of the page cache
+            # instead of copying the whole file into an intermediate bytes object first.
+            with mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                out.ParseFromString(memoryview(mapped))
+    return out
+
+
+@lru_cache(maxsize=None)
+def _ensure_parent_dir(dirname: str):
+    Path(dirname).mkdir(parents=True, exist_ok=True)
 
 
 def write_proto_to_file(proto, path):
-    Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+    # Registration writes many protos into the same few directories; the cache skips the
+    # repeated mkdir syscalls after the first write to each directory.
+    _ensure_parent_dir(os.path.dirname(path))
     with open(path, "wb") as writer:
         writer.write(proto.SerializeToString())
 
 
+class BatchedProtoWriter:
+    """
+    Writes a sequence of protobuf messages to a single file as length-prefixed records: each record is the
+    serialized size as a 4-byte little-endian integer followed by the message bytes. Callers that serialize
+    many protos in succession (e.g. task and workflow registration) pay one open/close and share one
+    buffered stream, instead of a file per message as with :py:func:`write_proto_to_file`.
+    """
+
+    def __init__(self, path):
+        """
+        :param Text path: path of the output file; parent directories are created if missing
+        """
+        _ensure_parent_dir(os.path.dirname(path))
+        self._writer = open(path, "wb")
+
+    def write(self, proto):
+        data = proto.SerializeToString()
+        self._writer.write(len(data).to_bytes(4, "little"))
+        self._writer.write(data)
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class Directory(object):
     def __init__(self, path):
         """
@@ -227,7 +347,9 @@ class Directory(object):
         The list of absolute filepaths for all immediate sub-paths
         :rtype: list[Text]
         """
-        return [os.path.join(self.name, f) for f in os.listdir(self.name)]
+        # scandir entries carry the joined path already, saving an os.path.join per entry.
+        with os.scandir(self.name) as entries:
+            return [entry.path for entry in entries]
 
     def __enter__(self):
         pass
@@ -250,10 +372,17 @@ class AutoDeletingTempDir(Directory):
         self._tmp_dir = tmp_dir
         self._working_dir_prefix = (working_dir_prefix + "_") if working_dir_prefix else ""
         self._cleanup = cleanup
+        self._temp_dir = None
         super(AutoDeletingTempDir, self).__init__(None)
 
     def __enter__(self):
-        self._name = tempfile.mkdtemp(dir=self._tmp_dir, prefix=self._working_dir_prefix)
+        if self._cleanup:
+            # TemporaryDirectory removes the directory natively on cleanup and keeps a finalizer as a
+            # safety net, so no exists() check is needed before deletion.
+            self._temp_dir = tempfile.TemporaryDirectory(dir=self._tmp_dir, prefix=self._working_dir_prefix)
+            self._name = self._temp_dir.name
+        else:
+            self._name = tempfile.mkdtemp(dir=self._tmp_dir, prefix=self._working_dir_prefix)
         return self
 
     def get_named_tempfile(self, name):
@@ -261,8 +390,9 @@ class AutoDeletingTempDir(Directory):
 
     def _cleanup_dir(self):
         if self.name and self._cleanup:
-            if os.path.exists(self.name):
-                shutil.rmtree(self.name)
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+                self._temp_dir = None
             self._name = None
 
     def force_cleanup(self):
@@ -295,9 +425,10 @@ class timeit:
         :param name: A string that describes the wrapped code block or function being executed.
         """
         self._name = name
-        self.start_time = None
+        self._start_ns = None
         self._start_wall_time = None
         self._start_process_time = None
+        self._timeline_deck = None
 
     def __call__(self, func: Callable):
         @wraps(func)
@@ -308,7 +439,12 @@ class timeit:
         return wrapper
 
     def __enter__(self):
-        self.start_time = datetime.datetime.now(datetime.timezone.utc)
+        # Resolve the timeline deck once on entry so exit does not have to chase the
+        # context -> user_space_params -> timeline_deck attribute chain again.
+        self._timeline_deck = _flyte_context_manager().current_context().user_space_params.timeline_deck
+        # time_ns is roughly an order of magnitude cheaper than building a tz-aware datetime;
+        # the datetime objects the timeline deck expects are only materialized on exit.
+        self._start_ns = time.time_ns()
         self._start_wall_time = time.perf_counter()
         self._start_process_time = time.process_time()
         return self
@@ -318,30 +454,32 @@ class timeit:
         The exception, if any, will propagate outside the context manager, as the purpose of this context manager
         is solely to measure the execution time of the wrapped code block.
         """
-        from flytekit.core.context_manager import FlyteContextManager
-
-        end_time = datetime.datetime.now(datetime.timezone.utc)
+        end_ns = time.time_ns()
         end_wall_time = time.perf_counter()
         end_process_time = time.process_time()
 
-        timeline_deck = FlyteContextManager.current_context().user_space_params.timeline_deck
-        timeline_deck.append_time_info(
+        utc = datetime.timezone.utc
+        start_time = datetime.datetime.fromtimestamp(self._start_ns / 1e9, tz=utc)
+        end_time = datetime.datetime.fromtimestamp(end_ns / 1e9, tz=utc)
+
+        self._timeline_deck.append_time_info(
             dict(
                 Name=self._name,
-                Start=self.start_time,
+                Start=start_time,
                 Finish=end_time,
                 WallTime=end_wall_time - self._start_wall_time,
                 ProcessTime=end_process_time - self._start_process_time,
             )
         )
 
-        logger.info(
-            "{}. [Wall Time: {}s, Process Time: {}s]".format(
-                self._name,
-                end_wall_time - self._start_wall_time,
-                end_process_time - self._start_process_time,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "{}. [Wall Time: {}s, Process Time: {}s]".format(
+                    self._name,
+                    end_wall_time - self._start_wall_time,
+                    end_process_time - self._start_process_time,
+                )
             )
-        )
 
 
 class ClassDecorator(ABC):
@@ -365,14 +503,15 @@ class ClassDecorator(ABC):
             wraps(task_function)(self)
 
     def __call__(self, *args, **kwargs):
+        # Note: the branch below cannot be specialized away by rebinding self.__call__ at construction
+        # time, because CPython resolves dunder methods on the type, not the instance.
         if self.task_function:
             # Where the actual execution happens.
             return self.execute(*args, **kwargs)
-        else:
-            # If self.func is None, it means decorator was called with arguments.
-            # Therefore, __call__ received the actual function to be decorated.
-            # We return a new instance of ClassDecorator with the function and stored arguments.
-            return self.__class__(args[0], **self.decorator_kwargs)
+        # If self.func is None, it means decorator was called with arguments.
+        # Therefore, __call__ received the actual function to be decorated.
+        # We return a new instance of ClassDecorator with the function and stored arguments.
+        return self.__class__(args[0], **self.decorator_kwargs)
 
     @abstractmethod
     def execute(self, *args, **kwargs):
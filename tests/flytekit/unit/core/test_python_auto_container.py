@@ -380,3 +380,31 @@ def test_pod_template_with_image_spec(default_serialization_settings, mock_image
     pod = image_spec_task.get_k8s_pod(default_serialization_settings)
     assert pod.pod_spec["containers"][0]["image"] == image_spec_1.image_name()
     assert pod.pod_spec["containers"][1]["image"] == image_spec_2.image_name()
+
+
+mutation_check_pod_template = PodTemplate(
+    primary_container_name="primary",
+    pod_spec=V1PodSpec(
+        containers=[
+            V1Container(name="sidecar", image="repo/sidecarImage:0.0.0"),
+        ]
+    ),
+)
+
+mutation_check_task = DummyAutoContainerTask(
+    name="mutation-check",
+    task_config=None,
+    task_type="t",
+    environment={"eKeyA": "eValA"},
+    pod_template=mutation_check_pod_template,
+)
+
+
+def test_pod_template_not_mutated_by_serialization(default_serialization_settings):
+    mutation_check_task.get_k8s_pod(default_serialization_settings)
+
+    # the placeholder primary container is not inserted into the caller's pod spec,
+    # and the sidecar image is not overwritten with the resolved registration image
+    containers = mutation_check_pod_template.pod_spec.containers
+    assert [c.name for c in containers] == ["sidecar"]
+    assert containers[0].image == "repo/sidecarImage:0.0.0"
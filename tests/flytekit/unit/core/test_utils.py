@@ -102,3 +102,26 @@ def test_class_decorator():
 
     ts = get_serializable_task(OrderedDict(), ss, t)
     assert ts.template.config == {"foo": "baz"}
+
+
+def test_batched_proto_writer(tmp_path):
+    from flyteidl.core import tasks_pb2
+
+    from flytekit.core.utils import BatchedProtoWriter
+
+    protos = [tasks_pb2.TaskTemplate(type=f"task-type-{i}") for i in range(3)]
+    path = tmp_path / "tasks.pb"
+    with BatchedProtoWriter(str(path)) as writer:
+        for proto in protos:
+            writer.write(proto)
+
+    data = path.read_bytes()
+    offset = 0
+    for proto in protos:
+        size = int.from_bytes(data[offset : offset + 4], "little")
+        offset += 4
+        restored = tasks_pb2.TaskTemplate()
+        restored.ParseFromString(data[offset : offset + size])
+        offset += size
+        assert restored == proto
+    assert offset == len(data)